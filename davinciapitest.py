@@ -2,7 +2,19 @@
 
 import sys
 import os
-import traceback
+
+# Full tracebacks are only formatted when asked for
+VERBOSE = "--verbose" in sys.argv[1:]
+
+
+def print_traceback():
+    """Print the current exception's traceback with --verbose, otherwise just a hint."""
+    if VERBOSE:
+        import traceback
+        traceback.print_exc(file=sys.stdout)
+    else:
+        print("(run with --verbose for the full traceback)")
+
 
 # Check Python version
 print(f"Python version: {sys.version}")
@@ -39,7 +51,8 @@ if not os.path.isdir(modules_path):
     sys.exit(1)
 
 print(f"Using API modules path: {modules_path}")
-sys.path.append(modules_path)
+if modules_path not in sys.path:
+    sys.path.append(modules_path)
 
 # Attempt to import DaVinciResolveScript
 print("Attempting to import DaVinciResolveScript...")
@@ -49,11 +62,11 @@ try:
     print("Import successful!")
 except ImportError as e:
     print(f"ImportError: {e}")
-    print(traceback.format_exc())
+    print_traceback()
     sys.exit(1)
 except Exception as e:
     print(f"Unexpected error during import: {e}")
-    print(traceback.format_exc())
+    print_traceback()
     sys.exit(1)
 
 # Connect to Resolve
@@ -67,7 +80,7 @@ try:
         sys.exit(1)
 except Exception as e:
     print(f"Error connecting to Resolve: {e}")
-    print(traceback.format_exc())
+    print_traceback()
     sys.exit(1)
 
 # Get basic information
@@ -86,6 +99,6 @@ try:
         print("No project currently open")
 except Exception as e:
     print(f"Error getting Resolve information: {e}")
-    print(traceback.format_exc())
+    print_traceback()
 
 print("\nScript completed successfully!")
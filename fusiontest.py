@@ -3,6 +3,11 @@ import os
 
 def load_dynamic(module_name, file_path):
     print(f"Attempting to load module: {module_name} from {file_path}")
+    # Extension modules are keyed by name; don't re-run module init if already loaded
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
     import importlib.machinery
     import importlib.util
 
@@ -12,7 +17,13 @@ def load_dynamic(module_name, file_path):
         print("Failed to create a spec for the module.")
         return None
     module = importlib.util.module_from_spec(spec)
-    loader.exec_module(module)
+    # Register like a regular import so later calls hit the sys.modules fast path
+    sys.modules[module_name] = module
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
     return module
 
 try:
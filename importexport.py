@@ -15,21 +15,119 @@ Requirements:
 
 import sys
 import os
-import traceback
+import functools
+import operator
+from itertools import chain
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
+
+
+# Common video/audio/image file extensions, matched with str.endswith
+_MEDIA_EXT_TUPLE = (
+    '.mp4', '.mov', '.avi', '.mkv', '.mxf', '.r3d', '.braw',
+    '.wav', '.aiff', '.mp3', '.m4a', '.flac',
+    '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.exr', '.dpx',
+)
+# Only this many trailing characters need lower-casing before the match
+_MEDIA_EXT_MAXLEN = max(map(len, _MEDIA_EXT_TUPLE))
+
+# C-level callables for the per-item loops
+_get_mp = operator.methodcaller('GetMediaPoolItem')
+_get_mp_of_pair = operator.itemgetter(1)
+
+
+def _detect_paths():
+    """Return the platform-specific (scripting API dir, fusionscript library) paths."""
+    if sys.platform.startswith("win"):
+        resolve_script_api = os.path.join(
+            os.environ.get("PROGRAMDATA", "C:\\ProgramData"), 
+            "Blackmagic Design", "DaVinci Resolve", "Support", 
+            "Developer", "Scripting"
+        )
+        resolve_script_lib = os.path.join(
+            os.environ.get("PROGRAMFILES", "C:\\Program Files"), 
+            "Blackmagic Design", "DaVinci Resolve", "fusionscript.dll"
+        )
+    elif sys.platform.startswith("darwin"):
+        resolve_script_api = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting"
+        resolve_script_lib = "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so"
+    else:  # Linux
+        resolve_script_api = "/opt/resolve/Developer/Scripting"
+        resolve_script_lib = "/opt/resolve/libs/Fusion/fusionscript.so"
+    
+    return resolve_script_api, resolve_script_lib
+
+
+# The platform can't change at runtime, so resolve the install paths once at import
+_RESOLVE_SCRIPT_API, _RESOLVE_SCRIPT_LIB = _detect_paths()
+_MODULES_PATH = os.path.join(_RESOLVE_SCRIPT_API, "Modules")
+
+
+@functools.lru_cache(maxsize=1)
+def _connect_once():
+    """Import DaVinciResolveScript and open the Resolve handle once per process."""
+    import DaVinciResolveScript as dvr_script
+    return dvr_script, dvr_script.scriptapp("Resolve")
+
+
+class TimelineView:
+    """Caches per-timeline values that are otherwise re-queried from Resolve."""
+    
+    def __init__(self, timeline):
+        self.timeline = timeline
+    
+    @functools.cached_property
+    def video_track_count(self) -> int:
+        return self.timeline.GetTrackCount('video')
+    
+    @functools.cached_property
+    def audio_track_count(self) -> int:
+        return self.timeline.GetTrackCount('audio')
+    
+    @functools.cached_property
+    def start_frame(self) -> int:
+        return self.timeline.GetStartFrame()
+    
+    @functools.cached_property
+    def end_frame(self) -> int:
+        return self.timeline.GetEndFrame()
+    
+    def track_count(self, kind: str) -> int:
+        """Return the cached track count for 'video' or 'audio'."""
+        return self.video_track_count if kind == 'video' else self.audio_track_count
+
+
+def _collect_all_items(view: TimelineView, kinds=('video', 'audio')) -> list:
+    """
+    Walk every track of the given kinds once.
+    
+    Returns:
+        A flat list of (timeline_item, media_pool_item) pairs; media_pool_item
+        is None for generated/effect items with no media pool clip
+    """
+    get_items = view.timeline.GetItemListInTrack
+    all_items = list(chain.from_iterable(
+        get_items(kind, track_idx)
+        for kind in kinds
+        for track_idx in range(1, view.track_count(kind) + 1)
+    ))
+    return list(zip(all_items, map(_get_mp, all_items)))
 
 
 class ResolveConnection:
     """Handles connection to DaVinci Resolve and API setup."""
     
+    # Set once the environment has been set up; shared by every connection
+    _env_ready = False
+    
     def __init__(self):
         self.resolve = None
         self.project_manager = None
         self.current_project = None
         self.current_timeline = None
-        self._setup_environment()
-        
+        self.timeline_view = None
+        self.media_pool = None
+    
     def _setup_environment(self):
         """Set up DaVinci Resolve API environment variables and paths."""
         print("Setting up DaVinci Resolve API environment...")
@@ -38,47 +136,33 @@ class ResolveConnection:
         if sys.maxsize <= 2**32:
             raise RuntimeError("DaVinci Resolve requires 64-bit Python!")
         
-        # Set platform-specific paths
-        if sys.platform.startswith("win"):
-            resolve_script_api = os.path.join(
-                os.environ.get("PROGRAMDATA", "C:\\ProgramData"), 
-                "Blackmagic Design", "DaVinci Resolve", "Support", 
-                "Developer", "Scripting"
-            )
-            resolve_script_lib = os.path.join(
-                os.environ.get("PROGRAMFILES", "C:\\Program Files"), 
-                "Blackmagic Design", "DaVinci Resolve", "fusionscript.dll"
-            )
-        elif sys.platform.startswith("darwin"):
-            resolve_script_api = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting"
-            resolve_script_lib = "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so"
-        else:  # Linux
-            resolve_script_api = "/opt/resolve/Developer/Scripting"
-            resolve_script_lib = "/opt/resolve/libs/Fusion/fusionscript.so"
-        
-        # Set environment variables
-        os.environ["RESOLVE_SCRIPT_API"] = resolve_script_api
-        os.environ["RESOLVE_SCRIPT_LIB"] = resolve_script_lib
+        os.environ["RESOLVE_SCRIPT_API"] = _RESOLVE_SCRIPT_API
+        os.environ["RESOLVE_SCRIPT_LIB"] = _RESOLVE_SCRIPT_LIB
         
         # Add modules to Python path
-        modules_path = os.path.join(resolve_script_api, "Modules")
-        if not os.path.isdir(modules_path):
-            raise RuntimeError(f"Resolve scripting modules path does not exist: {modules_path}")
+        if not os.path.isdir(_MODULES_PATH):
+            raise RuntimeError(f"Resolve scripting modules path does not exist: {_MODULES_PATH}")
         
-        if modules_path not in sys.path:
-            sys.path.append(modules_path)
+        if _MODULES_PATH not in sys.path:
+            sys.path.append(_MODULES_PATH)
         
-        print(f"✓ API modules path: {modules_path}")
+        print(f"✓ API modules path: {_MODULES_PATH}")
     
     def connect(self):
         """Establish connection to DaVinci Resolve."""
+        # Environment setup is deferred until the first connect and then skipped
+        if not ResolveConnection._env_ready:
+            self._setup_environment()
+            ResolveConnection._env_ready = True
+        
         print("Connecting to DaVinci Resolve...")
         
         try:
-            import DaVinciResolveScript as dvr_script
-            self.resolve = dvr_script.scriptapp("Resolve")
+            _, self.resolve = _connect_once()
             
             if not self.resolve:
+                # Don't keep a failed handshake cached; retry on next connect()
+                _connect_once.cache_clear()
                 raise RuntimeError("Failed to connect to Resolve. Make sure Resolve is running.")
             
             self.project_manager = self.resolve.GetProjectManager()
@@ -88,18 +172,20 @@ class ResolveConnection:
                 raise RuntimeError("No project is currently open. Please open a project in DaVinci Resolve.")
             
             self.current_timeline = self.current_project.GetCurrentTimeline()
+            if self.current_timeline:
+                self.timeline_view = TimelineView(self.current_timeline)
+            self.media_pool = self.current_project.GetMediaPool()
             
             # Print connection info
             version = self.resolve.GetVersionString()
             project_name = self.current_project.GetName()
             
-            print(f"✓ Connected to DaVinci Resolve {version}")
-            print(f"✓ Current project: {project_name}")
+            print(f"✓ Connected to DaVinci Resolve {version}\n✓ Current project: {project_name}")
             
             if self.current_timeline:
                 timeline_name = self.current_timeline.GetName()
-                start_frame = self.current_timeline.GetStartFrame()
-                end_frame = self.current_timeline.GetEndFrame()
+                start_frame = self.timeline_view.start_frame
+                end_frame = self.timeline_view.end_frame
                 duration = end_frame - start_frame + 1
                 print(f"✓ Current timeline: {timeline_name} (frames {start_frame}-{end_frame}, duration: {duration})")
             else:
@@ -112,6 +198,12 @@ class ResolveConnection:
         except Exception as e:
             raise RuntimeError(f"Connection error: {e}")
     
+    def set_current_timeline(self, timeline):
+        """Make `timeline` current in Resolve and refresh the cached timeline view."""
+        self.current_project.SetCurrentTimeline(timeline)
+        self.current_timeline = timeline
+        self.timeline_view = TimelineView(timeline)
+    
     def ensure_timeline(self):
         """Ensure a timeline is open."""
         if not self.current_timeline:
@@ -124,7 +216,7 @@ class OTIOManager:
     def __init__(self, connection: ResolveConnection):
         self.connection = connection
     
-    def export_current_timeline(self, output_path: str) -> bool:
+    def export_current_timeline(self, output_path: Path) -> bool:
         """
         Export the currently open timeline to OTIO format.
         
@@ -140,21 +232,21 @@ class OTIOManager:
         timeline_name = timeline.GetName()
         
         # Ensure output directory exists
-        output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Ensure .otio extension
         if output_path.suffix.lower() != '.otio':
             output_path = output_path.with_suffix('.otio')
+        output_str = str(output_path)
         
-        print(f"\nExporting timeline '{timeline_name}' to: {output_path}")
+        print(f"\nExporting timeline '{timeline_name}' to: {output_str}")
         
         try:
             # Export using OTIO format
-            success = timeline.Export(str(output_path), self.connection.resolve.EXPORT_OTIO, self.connection.resolve.EXPORT_NONE)
+            success = timeline.Export(output_str, self.connection.resolve.EXPORT_OTIO, self.connection.resolve.EXPORT_NONE)
             
             if success:
-                print(f"✓ Successfully exported timeline to {output_path}")
+                print(f"✓ Successfully exported timeline to {output_str}")
                 return True
             else:
                 raise RuntimeError("Export operation failed")
@@ -162,7 +254,7 @@ class OTIOManager:
         except Exception as e:
             raise RuntimeError(f"Failed to export timeline: {e}")
     
-    def import_otio(self, otio_file_path: str, timeline_name: Optional[str] = None) -> bool:
+    def import_otio(self, otio_file_path: Union[str, Path], timeline_name: Optional[str] = None) -> bool:
         """
         Import an OTIO file as a new timeline in DaVinci Resolve.
         
@@ -175,232 +267,199 @@ class OTIOManager:
         """
         # Validate file
         otio_path = Path(otio_file_path)
-        if not otio_path.exists():
+        try:
+            file_size = otio_path.stat().st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"OTIO file not found: {otio_file_path}")
         
         if otio_path.suffix.lower() != '.otio':
             raise ValueError(f"File must have .otio extension: {otio_file_path}")
         
+        otio_str = str(otio_path)
+        parent_str = str(otio_path.parent)
+        
         # Generate timeline name if not provided
         if not timeline_name:
             timeline_name = otio_path.stem
         
-        print(f"\nImporting OTIO file: {otio_path}")
-        print(f"Creating new timeline: {timeline_name}")
-        print(f"File size: {otio_path.stat().st_size} bytes")
+        print("\n".join((
+            f"\nImporting OTIO file: {otio_str}",
+            f"Creating new timeline: {timeline_name}",
+            f"File size: {file_size} bytes",
+        )))
         
         try:
             # Get media pool
-            media_pool = self.connection.current_project.GetMediaPool()
+            media_pool = self.connection.media_pool
             if not media_pool:
                 raise RuntimeError("Failed to get media pool")
             
+            # First, try to import any media files in the source directory to media pool
+            print("\n".join((
+                "Creating timeline from OTIO...",
+                f"Using source clips path: {parent_str}",
+                "Pre-importing media files to media pool...",
+            )))
+            self._preimport_media_files(parent_str)
+            
             # Import OTIO as a new timeline
             import_options = {
                 'timelineName': timeline_name,
                 'importSourceClips': True,
-                'sourceClipsPath': str(otio_path.parent),
+                'sourceClipsPath': parent_str,
                 'sourceClipsFolders': [],  # Will search current media pool
                 'interlaceProcessing': False
             }
             
-            print("Creating timeline from OTIO...")
-            print(f"Using source clips path: {otio_path.parent}")
-            
-            # First, try to import any media files in the source directory to media pool
-            print("Pre-importing media files to media pool...")
-            self._preimport_media_files(otio_path.parent)
-            
-            new_timeline = media_pool.ImportTimelineFromFile(str(otio_path), import_options)
-            
-            if not new_timeline:
-                # Try with different options if first attempt fails
-                print("First import attempt failed, trying with different options...")
-                import_options = {
-                    'timelineName': timeline_name,
-                    'importSourceClips': False,  # Don't try to import source clips
-                    'interlaceProcessing': False
-                }
-                new_timeline = media_pool.ImportTimelineFromFile(str(otio_path), import_options)
+            new_timeline = media_pool.ImportTimelineFromFile(otio_str, import_options)
             
             if not new_timeline:
-                # Try without any import options
-                print("Second import attempt failed, trying with minimal options...")
-                new_timeline = media_pool.ImportTimelineFromFile(str(otio_path), {})
-            
-            if not new_timeline:
-                raise RuntimeError("Failed to import OTIO file - all import attempts failed. The OTIO file may be corrupted or incompatible.")
+                raise RuntimeError("ImportTimelineFromFile returned no timeline. The OTIO file may be corrupted or incompatible.")
             
             print("✓ Timeline created successfully")
             
             # Set the new timeline as current
-            self.connection.current_project.SetCurrentTimeline(new_timeline)
-            self.connection.current_timeline = new_timeline  # Update our reference
-            
-            # Get timeline information
-            video_tracks = new_timeline.GetTrackCount('video')
-            audio_tracks = new_timeline.GetTrackCount('audio')
-            start_frame = new_timeline.GetStartFrame()
-            end_frame = new_timeline.GetEndFrame()
-            
-            print(f"\nTimeline info:")
-            print(f"  Name: {timeline_name}")
-            print(f"  Video tracks: {video_tracks}")
-            print(f"  Audio tracks: {audio_tracks}")
-            print(f"  Frame range: {start_frame} to {end_frame}")
-            
-            # Count timeline items for reporting
-            total_items = 0
-            media_items = 0
-            
-            for track_idx in range(1, video_tracks + 1):
-                track_items = new_timeline.GetItemListInTrack('video', track_idx)
-                total_items += len(track_items)
-                for item in track_items:
-                    if item.GetMediaPoolItem():
-                        media_items += 1
-            
-            for track_idx in range(1, audio_tracks + 1):
-                track_items = new_timeline.GetItemListInTrack('audio', track_idx)
-                total_items += len(track_items)
-                for item in track_items:
-                    if item.GetMediaPoolItem():
-                        media_items += 1
-            
-            print(f"  Total timeline items: {total_items}")
-            print(f"  Media-based items: {media_items}")
-            print(f"  Generated/effect items: {total_items - media_items}")
+            self.connection.set_current_timeline(new_timeline)
+            view = self.connection.timeline_view
+            
+            info_lines = [
+                "\nTimeline info:",
+                f"  Name: {timeline_name}",
+                f"  Video tracks: {view.video_track_count}",
+                f"  Audio tracks: {view.audio_track_count}",
+                f"  Frame range: {view.start_frame} to {view.end_frame}",
+            ]
+            
+            # Walk the tracks once; the same list feeds the report and the relink
+            collected = _collect_all_items(view)
+            total_items = len(collected)
+            media_items = sum(map(bool, map(_get_mp_of_pair, collected)))
+            
+            info_lines += [
+                f"  Total timeline items: {total_items}",
+                f"  Media-based items: {media_items}",
+                f"  Generated/effect items: {total_items - media_items}",
+                "\nChecking for offline clips and attempting relink...",
+            ]
+            print("\n".join(info_lines))
             
             # Try to relink any offline clips
-            print(f"\nChecking for offline clips and attempting relink...")
-            self._relink_offline_clips(new_timeline, otio_path.parent)
+            self._relink_offline_clips(collected, parent_str)
             
-            print(f"\n✓ Successfully imported OTIO as timeline '{timeline_name}'")
-            print(f"✓ Timeline set as current timeline")
+            print(f"\n✓ Successfully imported OTIO as timeline '{timeline_name}'\n✓ Timeline set as current timeline")
             
             return True
                 
         except Exception as e:
             raise RuntimeError(f"Failed to import OTIO file: {e}")
     
-    def _relink_offline_clips(self, timeline, source_path):
-        """Attempt to relink any offline clips in the timeline."""
+    def _relink_offline_clips(self, collected, source_path: str):
+        """
+        Attempt to relink any offline clips in the current timeline.
+        
+        Args:
+            collected: Timeline items as returned by _collect_all_items
+            source_path: Folder to relink the offline clips against
+        """
         try:
-            media_pool = self.connection.current_project.GetMediaPool()
-            
-            # Collect all timeline items that might need relinking
-            offline_items = []
-            video_tracks = timeline.GetTrackCount('video')
-            audio_tracks = timeline.GetTrackCount('audio')
-            
-            # Check video tracks
-            for track_idx in range(1, video_tracks + 1):
-                track_items = timeline.GetItemListInTrack('video', track_idx)
-                for item in track_items:
-                    mp_item = item.GetMediaPoolItem()
-                    if mp_item:
-                        # Check if the clip appears to be offline (this is a heuristic)
-                        clip_name = mp_item.GetName()
-                        if "Media Offline" in clip_name or not mp_item.GetClipProperty("File Path"):
-                            offline_items.append(mp_item)
-            
-            # Check audio tracks
-            for track_idx in range(1, audio_tracks + 1):
-                track_items = timeline.GetItemListInTrack('audio', track_idx)
-                for item in track_items:
-                    mp_item = item.GetMediaPoolItem()
-                    if mp_item:
-                        clip_name = mp_item.GetName()
-                        if "Media Offline" in clip_name or not mp_item.GetClipProperty("File Path"):
-                            offline_items.append(mp_item)
-            
-            if offline_items:
-                print(f"Found {len(offline_items)} potentially offline clips")
-                print("Attempting to relink clips...")
-                
-                # Try to relink clips to source folder
-                success = media_pool.RelinkClips(offline_items, str(source_path))
-                if success:
-                    print("✓ Successfully relinked offline clips")
-                else:
-                    print("⚠ Relink attempt completed (some clips may still be offline)")
-                    
-                # Alternative approach: try reconform from bins
-                print("Attempting timeline reconform...")
-                try:
-                    # Note: This method may not be available in all versions
-                    timeline_reconform_success = timeline.ImportIntoTimeline(
-                        "", {
-                            'autoImportSourceClipsIntoMediaPool': True,
-                            'sourceClipsPath': str(source_path)
-                        }
-                    )
-                    if timeline_reconform_success:
-                        print("✓ Timeline reconform successful")
-                except Exception as reconform_error:
-                    print(f"⚠ Timeline reconform not available: {reconform_error}")
-            else:
+            media_pool = self.connection.media_pool
+            timeline = self.connection.current_timeline
+            
+            # Check if each clip appears to be offline (this is a heuristic)
+            offline_items = list(filter(self._is_offline, filter(None, map(_get_mp_of_pair, collected))))
+            
+            if not offline_items:
                 print("✓ No offline clips detected")
+                return
+            
+            print(f"Found {len(offline_items)} potentially offline clips\nAttempting to relink clips...")
+            
+            # Try to relink clips to source folder
+            if media_pool.RelinkClips(offline_items, source_path):
+                print("✓ Successfully relinked offline clips")
+                return
+            
+            print("⚠ Relink attempt completed (some clips may still be offline)")
+            
+            # Alternative approach: try reconform from bins, only when the relink fell short
+            print("Attempting timeline reconform...")
+            try:
+                # Note: This method may not be available in all versions
+                timeline_reconform_success = timeline.ImportIntoTimeline(
+                    "", {
+                        'autoImportSourceClipsIntoMediaPool': True,
+                        'sourceClipsPath': source_path
+                    }
+                )
+                if timeline_reconform_success:
+                    print("✓ Timeline reconform successful")
+            except Exception as reconform_error:
+                print(f"⚠ Timeline reconform not available: {reconform_error}")
                 
         except Exception as e:
-            print(f"⚠ Error during relink attempt: {e}")
-            print("You may need to manually relink clips using 'Conform Lock with Media Pool Clip'")
+            print(f"⚠ Error during relink attempt: {e}\n"
+                  "You may need to manually relink clips using 'Conform Lock with Media Pool Clip'")
     
-    def _preimport_media_files(self, source_path):
+    @staticmethod
+    def _is_offline(mp_item) -> bool:
+        """Heuristic: offline clips are renamed 'Media Offline' or have no file path."""
+        # Two keyed lookups; the path is only queried when the name looks online
+        return "Media Offline" in (mp_item.GetName() or "") or not mp_item.GetClipProperty("File Path")
+    
+    def _preimport_media_files(self, source_path: str):
         """Pre-import media files from source directory to improve linking."""
         try:
-            media_storage = self.connection.resolve.GetMediaStorage()
-            media_pool = self.connection.current_project.GetMediaPool()
+            media_pool = self.connection.media_pool
             
-            if not media_storage or not media_pool:
-                print("⚠ Could not access media storage or media pool")
+            if not media_pool:
+                print("⚠ Could not access media pool")
                 return
             
             # Get list of media files in the source directory
-            source_dir = Path(source_path)
-            if not source_dir.exists():
+            if not os.path.isdir(source_path):
                 print(f"⚠ Source directory does not exist: {source_path}")
                 return
             
-            # Common video/audio file extensions
-            media_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.mxf', '.r3d', '.braw', 
-                              '.wav', '.aiff', '.mp3', '.m4a', '.flac',
-                              '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.exr', '.dpx'}
-            
-            media_files = []
-            for file_path in source_dir.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in media_extensions:
-                    media_files.append(str(file_path))
-            
-            if media_files:
-                print(f"Found {len(media_files)} media files to pre-import")
-                # Import media files to media pool
-                imported_items = media_pool.ImportMedia(media_files)
-                if imported_items:
-                    print(f"✓ Pre-imported {len(imported_items)} media files")
-                else:
-                    print("⚠ Media pre-import completed (some files may not have imported)")
-            else:
+            # DirEntry.is_file() reuses the type info from the directory read
+            with os.scandir(source_path) as entries:
+                media_files = [
+                    entry.path for entry in entries
+                    if entry.is_file()
+                    and entry.name[-_MEDIA_EXT_MAXLEN:].lower().endswith(_MEDIA_EXT_TUPLE)
+                ]
+            
+            if not media_files:
                 print("No media files found in source directory")
+                return
+            
+            print(f"Found {len(media_files)} media files to pre-import")
+            # Hand the whole list over in one call; Resolve's scripting IPC is
+            # single-threaded, so splitting it into chunks would only add round-trips
+            imported_items = media_pool.ImportMedia(media_files)
+            if imported_items:
+                print(f"✓ Pre-imported {len(imported_items)} media files")
+            else:
+                print("⚠ Media pre-import completed (some files may not have imported)")
                 
         except Exception as e:
             print(f"⚠ Error during media pre-import: {e}")
 
 
+@functools.lru_cache(maxsize=64)
+def _format_prompt(prompt: str, default: Optional[str]) -> str:
+    """Build the input() prompt; menu prompts repeat, so the strings are reused."""
+    return f"{prompt} [{default}]: " if default else f"{prompt}: "
+
+
 def get_user_input(prompt: str, default: str = None) -> str:
     """Get user input with optional default value."""
-    if default:
-        user_input = input(f"{prompt} [{default}]: ").strip()
-        return user_input if user_input else default
-    else:
-        return input(f"{prompt}: ").strip()
+    user_input = input(_format_prompt(prompt, default)).strip()
+    return (user_input or default) if default else user_input
 
 
 def export_menu(otio_manager: OTIOManager):
     """Handle export functionality with user interaction."""
-    print("\n" + "="*50)
-    print("EXPORT CURRENT TIMELINE TO OTIO")
-    print("="*50)
+    print("\n".join(("\n" + "=" * 50, "EXPORT CURRENT TIMELINE TO OTIO", "=" * 50)))
     
     try:
         # Check if there's a current timeline
@@ -430,10 +489,9 @@ def export_menu(otio_manager: OTIOManager):
             return
         
         # Perform export
-        success = otio_manager.export_current_timeline(str(output_path))
+        success = otio_manager.export_current_timeline(output_path)
         if success:
-            print(f"\n✓ Export completed successfully!")
-            print(f"✓ File saved: {output_path}")
+            print(f"\n✓ Export completed successfully!\n✓ File saved: {output_path}")
         else:
             print(f"\n❌ Export failed!")
             
@@ -443,9 +501,7 @@ def export_menu(otio_manager: OTIOManager):
 
 def import_menu(otio_manager: OTIOManager):
     """Handle import functionality with user interaction."""
-    print("\n" + "="*50)
-    print("IMPORT OTIO FILE AS NEW TIMELINE")
-    print("="*50)
+    print("\n".join(("\n" + "=" * 50, "IMPORT OTIO FILE AS NEW TIMELINE", "=" * 50)))
     
     try:
         # Get full path to OTIO file directly
@@ -483,7 +539,7 @@ def import_menu(otio_manager: OTIOManager):
             return
         
         # Perform import
-        success = otio_manager.import_otio(str(otio_path), timeline_name)
+        success = otio_manager.import_otio(otio_path, timeline_name)
         if success:
             print(f"\n✓ Import completed successfully!")
         else:
@@ -493,11 +549,19 @@ def import_menu(otio_manager: OTIOManager):
         print(f"\n❌ Import error: {e}")
 
 
+_MAIN_MENU = "\n".join((
+    "\n" + "-" * 30,
+    "MAIN MENU",
+    "-" * 30,
+    "1. Export current timeline to OTIO",
+    "2. Import OTIO file as new timeline",
+    "3. Quit",
+))
+
+
 def main_menu():
     """Display and handle the main menu."""
-    print("\n" + "="*50)
-    print("DAVINCI RESOLVE OTIO IMPORT/EXPORT TOOL")
-    print("="*50)
+    print("\n".join(("\n" + "=" * 50, "DAVINCI RESOLVE OTIO IMPORT/EXPORT TOOL", "=" * 50)))
     
     try:
         # Establish connection
@@ -511,12 +575,7 @@ def main_menu():
         
         # Main menu loop
         while True:
-            print("\n" + "-"*30)
-            print("MAIN MENU")
-            print("-"*30)
-            print("1. Export current timeline to OTIO")
-            print("2. Import OTIO file as new timeline")
-            print("3. Quit")
+            print(_MAIN_MENU)
             
             choice = input("\nEnter your choice (1-3): ").strip()
             
@@ -534,11 +593,13 @@ def main_menu():
                 print("Invalid choice. Please enter 1, 2, or 3.")
                 
     except Exception as e:
-        print(f"\n❌ Error: {e}")
-        print("\nPlease ensure:")
-        print("- DaVinci Resolve is running")
-        print("- A project is open in DaVinci Resolve")
-        print("- Python is 64-bit")
+        print("\n".join((
+            f"\n❌ Error: {e}",
+            "\nPlease ensure:",
+            "- DaVinci Resolve is running",
+            "- A project is open in DaVinci Resolve",
+            "- Python is 64-bit",
+        )))
         return 1
     
     return 0
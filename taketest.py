@@ -4,58 +4,108 @@ DaVinci Resolve API Test Script
 Basic template for testing DaVinci Resolve API functionality.
 """
 
+from __future__ import annotations
+
 import sys
 import os
-import traceback
-from typing import Optional, Any
+
+
+# Scripting API location per platform; anything else is treated as Linux
+_PLATFORM_PATHS = {
+    "win32": os.path.join(
+        os.environ.get("PROGRAMDATA", "C:\\ProgramData"),
+        "Blackmagic Design", "DaVinci Resolve", "Support",
+        "Developer", "Scripting"
+    ),
+    "darwin": "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting",
+}
+_MODULES_PATH = os.path.join(
+    _PLATFORM_PATHS.get(sys.platform, "/opt/resolve/Developer/Scripting"), "Modules"
+)
+_IS_64BIT = sys.maxsize > (1 << 32)
+
+# API string arguments reused on every call
+_VIDEO = "video"
+_AUDIO = "audio"
+_FPS_KEY = "timelineFrameRate"
+
+# Section header rule
+_BAR = "=" * 50
+
+
+def _load_dvr_script():
+    """Import DaVinciResolveScript on first use and keep it as the module attribute `dvr_script`."""
+    module = globals().get("dvr_script")
+    if module is None:
+        import DaVinciResolveScript as module
+        globals()["dvr_script"] = module
+    return module
+
+
+def __getattr__(name: str):
+    """Resolve `dvr_script` lazily so importing this module doesn't load the Resolve SDK."""
+    if name == "dvr_script":
+        return _load_dvr_script()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class ResolveInfo:
+    """Basic Resolve/project details; fields left as None were not available."""
+    
+    __slots__ = ("version", "project_name", "fps", "width", "height")
+    
+    def __init__(self):
+        self.version: str | None = None
+        self.project_name: str | None = None
+        self.fps: object = None
+        self.width: object = None
+        self.height: object = None
 
 
 class DaVinciResolver:
     """Handler for DaVinci Resolve API connections and operations."""
     
+    __slots__ = ("resolve", "project_manager", "current_project", "current_timeline")
+    
+    # Set once the environment has been verified; shared by every instance
+    _env_ready = False
+    
     def __init__(self):
         self.resolve = None
         self.project_manager = None
         self.current_project = None
+        self.current_timeline = None
         
     def setup_environment(self) -> bool:
         """Set up the DaVinci Resolve API environment."""
+        if DaVinciResolver._env_ready:
+            return True
+            
         print("Setting up DaVinci Resolve API environment...")
         
         # Check Python architecture
-        if not sys.maxsize > 2**32:
+        if not _IS_64BIT:
             print("ERROR: DaVinci Resolve requires 64-bit Python!")
             return False
             
-        # Set platform-specific paths
-        if sys.platform.startswith("win"):
-            resolve_script_api = os.path.join(
-                os.environ.get("PROGRAMDATA", "C:\\ProgramData"), 
-                "Blackmagic Design", "DaVinci Resolve", "Support", 
-                "Developer", "Scripting"
-            )
-        elif sys.platform.startswith("darwin"):
-            resolve_script_api = "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting"
-        else:  # Linux
-            resolve_script_api = "/opt/resolve/Developer/Scripting"
-            
         # Verify modules path exists
-        modules_path = os.path.join(resolve_script_api, "Modules")
-        if not os.path.isdir(modules_path):
-            print(f"ERROR: Resolve scripting modules path does not exist: {modules_path}")
+        if not os.path.isdir(_MODULES_PATH):
+            print(f"ERROR: Resolve scripting modules path does not exist: {_MODULES_PATH}")
             print("Please check your DaVinci Resolve installation")
             return False
             
         # Add to Python path
-        sys.path.append(modules_path)
-        print(f"Added to Python path: {modules_path}")
+        if _MODULES_PATH not in sys.path:
+            sys.path.append(_MODULES_PATH)
+        print(f"Added to Python path: {_MODULES_PATH}")
+        DaVinciResolver._env_ready = True
         return True
         
     def connect(self) -> bool:
         """Connect to DaVinci Resolve instance."""
         try:
             print("Importing DaVinciResolveScript...")
-            import DaVinciResolveScript as dvr_script
+            dvr_script = _load_dvr_script()
             
             print("Connecting to DaVinci Resolve...")
             self.resolve = dvr_script.scriptapp("Resolve")
@@ -67,6 +117,9 @@ class DaVinciResolver:
             # Get project manager and current project
             self.project_manager = self.resolve.GetProjectManager()
             self.current_project = self.project_manager.GetCurrentProject()
+            self.current_timeline = (
+                self.current_project.GetCurrentTimeline() if self.current_project else None
+            )
             
             print("✓ Successfully connected to DaVinci Resolve!")
             return True
@@ -77,24 +130,25 @@ class DaVinciResolver:
             return False
         except Exception as e:
             print(f"Connection error: {e}")
-            print(traceback.format_exc())
+            import traceback
+            traceback.print_exc(file=sys.stdout)
             return False
             
-    def get_basic_info(self) -> dict:
+    def get_basic_info(self) -> ResolveInfo:
         """Get basic information about Resolve and current project."""
-        info = {}
+        info = ResolveInfo()
         
         try:
             if self.resolve:
-                info['version'] = self.resolve.GetVersionString()
+                info.version = self.resolve.GetVersionString()
                 
             if self.current_project:
-                info['project_name'] = self.current_project.GetName()
-                info['fps'] = self.current_project.GetSetting("timelineFrameRate")
-                info['width'] = self.current_project.GetSetting("timelineResolutionWidth")
-                info['height'] = self.current_project.GetSetting("timelineResolutionHeight")
+                info.project_name = self.current_project.GetName()
+                info.fps = self.current_project.GetSetting(_FPS_KEY)
+                info.width = self.current_project.GetSetting("timelineResolutionWidth")
+                info.height = self.current_project.GetSetting("timelineResolutionHeight")
             else:
-                info['project_name'] = "No project open"
+                info.project_name = "No project open"
                 
         except Exception as e:
             print(f"Error getting basic info: {e}")
@@ -106,34 +160,129 @@ class DaVinciResolver:
         self.resolve = None
         self.project_manager = None
         self.current_project = None
+        self.current_timeline = None
+
+
+def _banner(title: str):
+    """Write a section header (bar, title, bar) in a single write."""
+    sys.stdout.write(f"{_BAR}\n{title}\n{_BAR}\n")
 
 
 def print_system_info():
     """Print system and Python information."""
-    print("=" * 50)
-    print("SYSTEM INFORMATION")
-    print("=" * 50)
+    _banner("SYSTEM INFORMATION")
     print(f"Python version: {sys.version}")
     print(f"Platform: {sys.platform}")
-    print(f"Architecture: {'64-bit' if sys.maxsize > 2**32 else '32-bit'}")
+    print(f"Architecture: {'64-bit' if _IS_64BIT else '32-bit'}")
     print()
 
 
-def print_resolve_info(info: dict):
+def print_resolve_info(info: ResolveInfo):
     """Print DaVinci Resolve information."""
-    print("=" * 50)
-    print("DAVINCI RESOLVE INFORMATION")
-    print("=" * 50)
-    for key, value in info.items():
-        print(f"{key.replace('_', ' ').title()}: {value}")
+    _banner("DAVINCI RESOLVE INFORMATION")
+    for name in info.__slots__:
+        value = getattr(info, name)
+        if value is not None:
+            print(f"{name.replace('_', ' ').title()}: {value}")
     print()
 
 
+# Static findings printed by test_ripple_editing_functionality, written in one go
+_RIPPLE_REPORT = """\
+🗑️  RIPPLE DELETE CAPABILITY:
+------------------------------
+✓ DeleteClips([timelineItems], Bool) - Available!
+  • First parameter: List of timeline items to delete
+  • Second parameter: True = Ripple Delete, False = Standard Delete
+  • When ripple=True: Automatically closes gaps after deletion
+  • When ripple=False: Leaves empty space where clips were deleted
+
+📋 EXAMPLE USAGE:
+```python
+# Get clips to delete
+video_clips = current_timeline.GetItemListInTrack('video', 1)
+clips_to_delete = [video_clips[0]]  # Delete first clip
+
+# Standard delete (leaves gap)
+success = current_timeline.DeleteClips(clips_to_delete, False)
+
+# Ripple delete (closes gap)
+success = current_timeline.DeleteClips(clips_to_delete, True)
+```
+
+📥 RIPPLE INSERT INVESTIGATION:
+------------------------------
+Available insertion methods found:
+  • AppendToTimeline() - Adds clips to end of timeline
+  • InsertGeneratorIntoTimeline() - Inserts generators
+  • InsertFusionGeneratorIntoTimeline() - Inserts Fusion generators
+  • InsertTitleIntoTimeline() - Inserts titles
+  • InsertFusionTitleIntoTimeline() - Inserts Fusion titles
+
+⚠️  RIPPLE INSERT LIMITATION:
+  The DaVinci Resolve API does NOT appear to have a direct
+  'ripple insert' function that automatically pushes existing
+  clips to the right when inserting new content.
+
+🔧 RIPPLE INSERT WORKAROUNDS:
+------------------------------
+1. MANUAL RIPPLE INSERT SIMULATION:
+   - Get all clips after insertion point
+   - Calculate new positions (shift by insert duration)
+   - Move each clip to new position
+   - Insert new clip at desired position
+
+2. USE APPEND + REARRANGE:
+   - Append new clip to end of timeline
+   - Manually reposition clips as needed
+
+3. EXTERNAL WORKFLOW:
+   - Export EDL/XML with planned changes
+   - Re-import with new structure
+
+📝 PRACTICAL RIPPLE INSERT SIMULATION:
+```python
+def simulate_ripple_insert(timeline, track_type, track_index, 
+                          insert_frame, media_pool_item, duration):
+    # 1. Get all clips after insertion point
+    all_clips = timeline.GetItemListInTrack(track_type, track_index)
+    clips_to_move = []
+    for clip in all_clips:
+        if clip.GetStart() >= insert_frame:
+            clips_to_move.append(clip)
+
+    # 2. Calculate shift amount
+    shift_amount = duration
+
+    # 3. Move existing clips (would require additional API)
+    # Note: This step is problematic as there's no direct
+    # 'move clip' API function in DaVinci Resolve
+
+    # 4. Insert new clip
+    # timeline.AppendToTimeline([media_pool_item]) # Only appends to end
+```
+
+📊 API CAPABILITIES SUMMARY:
+------------------------------
+✅ Ripple Delete: FULLY SUPPORTED
+   - DeleteClips([items], True) performs ripple delete
+
+❌ Ripple Insert: NOT DIRECTLY SUPPORTED
+   - No built-in function for ripple insert
+   - No direct clip positioning/moving functions
+   - Would require complex workarounds
+
+💡 RECOMMENDATION:
+   For ripple insert functionality, consider:
+   - Using DaVinci Resolve's UI for complex timeline edits
+   - Exporting/importing timeline data (EDL/XML)
+   - Building timeline structure from scratch when needed
+"""
+
+
 def test_ripple_editing_functionality(resolver: DaVinciResolver):
     """Test ripple delete and investigate ripple insert functionality."""
-    print("=" * 50)
-    print("RIPPLE EDITING FUNCTIONALITY")
-    print("=" * 50)
+    _banner("RIPPLE EDITING FUNCTIONALITY")
     
     if not resolver.current_project:
         print("! No project open - ripple editing tests skipped")
@@ -141,139 +290,28 @@ def test_ripple_editing_functionality(resolver: DaVinciResolver):
         return
     
     try:
-        # Get current timeline
-        current_timeline = resolver.current_project.GetCurrentTimeline()
+        # Timeline handle fetched once in connect()
+        current_timeline = resolver.current_timeline
         if not current_timeline:
             print("! No timeline currently selected - ripple editing tests skipped")
             print()
             return
             
         timeline_name = current_timeline.GetName()
-        print(f"Timeline: '{timeline_name}'")
-        print()
-        
-        # === RIPPLE DELETE FUNCTIONALITY ===
-        print("🗑️  RIPPLE DELETE CAPABILITY:")
-        print("-" * 30)
-        print("✓ DeleteClips([timelineItems], Bool) - Available!")
-        print("  • First parameter: List of timeline items to delete")
-        print("  • Second parameter: True = Ripple Delete, False = Standard Delete")
-        print("  • When ripple=True: Automatically closes gaps after deletion")
-        print("  • When ripple=False: Leaves empty space where clips were deleted")
-        print()
-        
-        # Show example usage
-        print("📋 EXAMPLE USAGE:")
-        print("```python")
-        print("# Get clips to delete")
-        print("video_clips = current_timeline.GetItemListInTrack('video', 1)")
-        print("clips_to_delete = [video_clips[0]]  # Delete first clip")
-        print()
-        print("# Standard delete (leaves gap)")
-        print("success = current_timeline.DeleteClips(clips_to_delete, False)")
-        print()
-        print("# Ripple delete (closes gap)")
-        print("success = current_timeline.DeleteClips(clips_to_delete, True)")
-        print("```")
-        print()
-        
-        # === RIPPLE INSERT INVESTIGATION ===
-        print("📥 RIPPLE INSERT INVESTIGATION:")
-        print("-" * 30)
-        
-        # Check available insert methods
-        media_pool = resolver.current_project.GetMediaPool()
-        
-        print("Available insertion methods found:")
-        insert_methods = [
-            "AppendToTimeline() - Adds clips to end of timeline",
-            "InsertGeneratorIntoTimeline() - Inserts generators", 
-            "InsertFusionGeneratorIntoTimeline() - Inserts Fusion generators",
-            "InsertTitleIntoTimeline() - Inserts titles",
-            "InsertFusionTitleIntoTimeline() - Inserts Fusion titles"
-        ]
-        
-        for method in insert_methods:
-            print(f"  • {method}")
-        
-        print()
-        print("⚠️  RIPPLE INSERT LIMITATION:")
-        print("  The DaVinci Resolve API does NOT appear to have a direct")
-        print("  'ripple insert' function that automatically pushes existing")
-        print("  clips to the right when inserting new content.")
-        print()
-        
-        # === WORKAROUND STRATEGIES ===
-        print("🔧 RIPPLE INSERT WORKAROUNDS:")
-        print("-" * 30)
-        print("1. MANUAL RIPPLE INSERT SIMULATION:")
-        print("   - Get all clips after insertion point")
-        print("   - Calculate new positions (shift by insert duration)")
-        print("   - Move each clip to new position")
-        print("   - Insert new clip at desired position")
-        print()
-        print("2. USE APPEND + REARRANGE:")
-        print("   - Append new clip to end of timeline")
-        print("   - Manually reposition clips as needed")
-        print()
-        print("3. EXTERNAL WORKFLOW:")
-        print("   - Export EDL/XML with planned changes")
-        print("   - Re-import with new structure")
-        print()
-        
-        # === PRACTICAL EXAMPLE ===
-        print("📝 PRACTICAL RIPPLE INSERT SIMULATION:")
-        print("```python")
-        print("def simulate_ripple_insert(timeline, track_type, track_index, ")
-        print("                          insert_frame, media_pool_item, duration):")
-        print("    # 1. Get all clips after insertion point")
-        print("    all_clips = timeline.GetItemListInTrack(track_type, track_index)")
-        print("    clips_to_move = []")
-        print("    for clip in all_clips:")
-        print("        if clip.GetStart() >= insert_frame:")
-        print("            clips_to_move.append(clip)")
-        print()
-        print("    # 2. Calculate shift amount")
-        print("    shift_amount = duration")
-        print()
-        print("    # 3. Move existing clips (would require additional API)")
-        print("    # Note: This step is problematic as there's no direct")
-        print("    # 'move clip' API function in DaVinci Resolve")
-        print()
-        print("    # 4. Insert new clip")
-        print("    # timeline.AppendToTimeline([media_pool_item]) # Only appends to end")
-        print("```")
-        print()
-        
-        # === API LIMITATIONS SUMMARY ===
-        print("📊 API CAPABILITIES SUMMARY:")
-        print("-" * 30)
-        print("✅ Ripple Delete: FULLY SUPPORTED")
-        print("   - DeleteClips([items], True) performs ripple delete")
-        print()
-        print("❌ Ripple Insert: NOT DIRECTLY SUPPORTED")
-        print("   - No built-in function for ripple insert")
-        print("   - No direct clip positioning/moving functions")
-        print("   - Would require complex workarounds")
-        print()
-        print("💡 RECOMMENDATION:")
-        print("   For ripple insert functionality, consider:")
-        print("   - Using DaVinci Resolve's UI for complex timeline edits")
-        print("   - Exporting/importing timeline data (EDL/XML)")
-        print("   - Building timeline structure from scratch when needed")
+        print(f"Timeline: '{timeline_name}'\n")
+        sys.stdout.write(_RIPPLE_REPORT)
         
     except Exception as e:
         print(f"✗ Ripple editing analysis failed: {e}")
-        print(traceback.format_exc())
+        import traceback
+        traceback.print_exc(file=sys.stdout)
     
     print()
 
 
 def test_timeline_clips_analysis(resolver: DaVinciResolver):
     """Analyze all clips on the current timeline - get names, positions, and in/out points."""
-    print("=" * 50)
-    print("TIMELINE CLIPS ANALYSIS")
-    print("=" * 50)
+    _banner("TIMELINE CLIPS ANALYSIS")
     
     if not resolver.current_project:
         print("! No project open - timeline analysis skipped")
@@ -281,91 +319,24 @@ def test_timeline_clips_analysis(resolver: DaVinciResolver):
         return
     
     try:
-        # Get current timeline
-        current_timeline = resolver.current_project.GetCurrentTimeline()
+        # Timeline handle fetched once in connect()
+        current_timeline = resolver.current_timeline
         if not current_timeline:
             print("! No timeline currently selected - timeline analysis skipped")
             print()
             return
             
         timeline_name = current_timeline.GetName()
-        timeline_fps = float(current_timeline.GetSetting("timelineFrameRate"))
+        timeline_fps = float(current_timeline.GetSetting(_FPS_KEY))
         print(f"Timeline: '{timeline_name}' @ {timeline_fps} fps")
-        print()
-        
-        total_clips = 0
         
-        # Analyze video tracks
-        video_track_count = current_timeline.GetTrackCount("video")
-        print(f"VIDEO TRACKS ({video_track_count}):")
-        print("-" * 30)
+        # Resolve the per-track callables once and share them across both track kinds
+        get_track_count = current_timeline.GetTrackCount
+        get_items = current_timeline.GetItemListInTrack
         
-        for track_index in range(1, video_track_count + 1):
-            track_items = current_timeline.GetItemListInTrack("video", track_index)
-            print(f"\nVideo Track {track_index}: {len(track_items)} clips")
-            
-            for item_index, timeline_item in enumerate(track_items, 1):
-                try:
-                    # Get clip information
-                    clip_name = timeline_item.GetName()
-                    start_frame = timeline_item.GetStart()  # Position on timeline (start)
-                    end_frame = timeline_item.GetEnd()      # Position on timeline (end)
-                    duration = timeline_item.GetDuration()  # Duration on timeline
-                    
-                    # Get source clip in/out points
-                    left_offset = timeline_item.GetLeftOffset()   # In point of source clip
-                    right_offset = timeline_item.GetRightOffset() # Out point of source clip
-                    
-                    # Calculate timecode
-                    start_tc = frames_to_timecode(start_frame, timeline_fps)
-                    end_tc = frames_to_timecode(end_frame, timeline_fps)
-                    duration_tc = frames_to_timecode(duration, timeline_fps)
-                    
-                    print(f"  [{item_index}] '{clip_name}'")
-                    print(f"      Timeline Position: {start_frame}-{end_frame} frames ({start_tc} - {end_tc})")
-                    print(f"      Duration: {duration} frames ({duration_tc})")
-                    print(f"      Source In/Out: {left_offset}/{right_offset} frames")
-                    
-                    total_clips += 1
-                    
-                except Exception as e:
-                    print(f"    ✗ Error analyzing clip {item_index}: {e}")
-        
-        # Analyze audio tracks
-        audio_track_count = current_timeline.GetTrackCount("audio")
-        print(f"\nAUDIO TRACKS ({audio_track_count}):")
-        print("-" * 30)
-        
-        for track_index in range(1, audio_track_count + 1):
-            track_items = current_timeline.GetItemListInTrack("audio", track_index)
-            print(f"\nAudio Track {track_index}: {len(track_items)} clips")
-            
-            for item_index, timeline_item in enumerate(track_items, 1):
-                try:
-                    # Get clip information
-                    clip_name = timeline_item.GetName()
-                    start_frame = timeline_item.GetStart()
-                    end_frame = timeline_item.GetEnd()
-                    duration = timeline_item.GetDuration()
-                    
-                    # Get source clip in/out points
-                    left_offset = timeline_item.GetLeftOffset()
-                    right_offset = timeline_item.GetRightOffset()
-                    
-                    # Calculate timecode
-                    start_tc = frames_to_timecode(start_frame, timeline_fps)
-                    end_tc = frames_to_timecode(end_frame, timeline_fps)
-                    duration_tc = frames_to_timecode(duration, timeline_fps)
-                    
-                    print(f"  [{item_index}] '{clip_name}'")
-                    print(f"      Timeline Position: {start_frame}-{end_frame} frames ({start_tc} - {end_tc})")
-                    print(f"      Duration: {duration} frames ({duration_tc})")
-                    print(f"      Source In/Out: {left_offset}/{right_offset} frames")
-                    
-                    total_clips += 1
-                    
-                except Exception as e:
-                    print(f"    ✗ Error analyzing clip {item_index}: {e}")
+        total_clips = 0
+        for kind in (_VIDEO, _AUDIO):
+            total_clips += _analyze_tracks(kind, timeline_fps, get_track_count, get_items)
         
         # Summary
         print(f"\n--- TIMELINE SUMMARY ---")
@@ -374,30 +345,149 @@ def test_timeline_clips_analysis(resolver: DaVinciResolver):
         
     except Exception as e:
         print(f"✗ Timeline analysis failed: {e}")
-        print(traceback.format_exc())
+        import traceback
+        traceback.print_exc(file=sys.stdout)
     
     print()
 
 
+def _analyze_tracks(kind: str, fps: float, get_track_count, get_items) -> int:
+    """
+    Print every clip on all tracks of one kind.
+    
+    Args:
+        kind: Track type, "video" or "audio"
+        fps: Timeline frame rate used for timecode conversion
+        get_track_count: The timeline's bound GetTrackCount
+        get_items: The timeline's bound GetItemListInTrack
+        
+    Returns:
+        Number of clips analyzed
+    """
+    fetch_fields = _fetch_clip_fields
+    total_clips = 0
+    
+    track_count = get_track_count(kind)
+    print(f"\n{kind.upper()} TRACKS ({track_count}):")
+    print("-" * 30)
+    
+    for track_index in range(1, track_count + 1):
+        track_items = get_items(kind, track_index)
+        print(f"\n{kind.title()} Track {track_index}: {len(track_items)} clips")
+        
+        # Fetch every clip's fields first, then format; a failed fetch keeps its
+        # error message in the clip's slot so it is reported in position
+        clips = []
+        add_clip = clips.append
+        for item_index, timeline_item in enumerate(track_items, 1):
+            try:
+                add_clip((item_index, *fetch_fields(timeline_item)))
+            except Exception as e:
+                add_clip(f"    ✗ Error analyzing clip {item_index}: {e}\n")
+        fetched = [clip for clip in clips if not isinstance(clip, str)]
+        
+        # Convert start/end/duration of the whole track in one batch
+        timecodes = frames_to_timecode_batch([frame for clip in fetched for frame in clip[2:5]], fps)
+        clip_timecodes = zip(timecodes[0::3], timecodes[1::3], timecodes[2::3])
+        rows = []
+        add_row = rows.append
+        for clip in clips:
+            if isinstance(clip, str):
+                add_row(clip)
+                continue
+            
+            item_index, clip_name, start_frame, end_frame, duration, left_offset, right_offset = clip
+            start_tc, end_tc, duration_tc = next(clip_timecodes)
+            
+            add_row(
+                f"  [{item_index}] '{clip_name}'\n"
+                f"      Timeline Position: {start_frame}-{end_frame} frames ({start_tc} - {end_tc})\n"
+                f"      Duration: {duration} frames ({duration_tc})\n"
+                f"      Source In/Out: {left_offset}/{right_offset} frames\n"
+            )
+        
+        # One write per track instead of four prints per clip
+        sys.stdout.write("".join(rows))
+        
+        total_clips += len(fetched)
+    
+    return total_clips
+
+
+def _fetch_clip_fields(timeline_item) -> tuple:
+    """
+    Read one timeline item's fields in a single pass.
+    
+    Returns:
+        (name, start, end, duration, left_offset, right_offset) where start/end/duration
+        are timeline positions and the offsets are the source clip's in/out points
+    """
+    return (timeline_item.GetName(), timeline_item.GetStart(), timeline_item.GetEnd(),
+            timeline_item.GetDuration(), timeline_item.GetLeftOffset(), timeline_item.GetRightOffset())
+
+
+def _integer_fps(fps: float) -> int | None:
+    """Return fps as an int for whole-number rates (24, 25, 30, ...), else None."""
+    fps_round = int(round(fps))
+    return fps_round if fps_round > 0 and abs(fps - fps_round) < 1e-6 else None
+
+
 def frames_to_timecode(frames: int, fps: float) -> str:
     """Convert frame number to timecode string (HH:MM:SS:FF)."""
     try:
-        total_seconds = frames / fps
-        hours = int(total_seconds // 3600)
-        minutes = int((total_seconds % 3600) // 60)
-        seconds = int(total_seconds % 60)
-        remaining_frames = int(frames % fps)
+        fps_int = _integer_fps(fps)
+        if fps_int and isinstance(frames, int):
+            # Whole-number rates stay in exact integer arithmetic
+            total_seconds, remaining_frames = divmod(frames, fps_int)
+            hours, remainder = divmod(total_seconds, 3600)
+            minutes, seconds = divmod(remainder, 60)
+        else:
+            total_seconds = frames / fps
+            hours = int(total_seconds // 3600)
+            minutes = int((total_seconds % 3600) // 60)
+            seconds = int(total_seconds % 60)
+            remaining_frames = int(frames % fps)
         
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{remaining_frames:02d}"
     except:
         return f"Frame {frames}"
 
 
+def frames_to_timecode_batch(frames: list, fps: float) -> list:
+    """
+    Convert a list of frame numbers to timecode strings (HH:MM:SS:FF).
+    
+    The fps is validated (and checked for a whole-number rate) once for the whole
+    batch instead of per frame; if anything is off, each frame goes through
+    frames_to_timecode and its fallback instead.
+    """
+    try:
+        if fps <= 0:
+            raise ValueError(f"Invalid frame rate: {fps}")
+        
+        fps_int = _integer_fps(fps)
+        timecodes = []
+        if fps_int:
+            for frames_value in frames:
+                total_seconds, remaining_frames = divmod(frames_value, fps_int)
+                hours, remainder = divmod(total_seconds, 3600)
+                minutes, seconds = divmod(remainder, 60)
+                timecodes.append(f"{hours:02d}:{minutes:02d}:{seconds:02d}:{remaining_frames:02d}")
+        else:
+            for frames_value in frames:
+                hours, remainder = divmod(int(frames_value / fps), 3600)
+                minutes, seconds = divmod(remainder, 60)
+                timecodes.append(
+                    f"{hours:02d}:{minutes:02d}:{seconds:02d}:{int(frames_value % fps):02d}"
+                )
+        return timecodes
+    except Exception:
+        return [frames_to_timecode(frames_value, fps) for frames_value in frames]
+
+
 def test_basic_functionality(resolver: DaVinciResolver):
     """Test basic DaVinci Resolve API functionality."""
-    print("=" * 50)
-    print("TESTING BASIC FUNCTIONALITY")
-    print("=" * 50)
+    _banner("TESTING BASIC FUNCTIONALITY")
     
     # Add your test functionality here
     # Examples:
@@ -428,7 +518,7 @@ def test_basic_functionality(resolver: DaVinciResolver):
     # Test 3: Current timeline info
     try:
         if resolver.current_project:
-            current_timeline = resolver.current_project.GetCurrentTimeline()
+            current_timeline = resolver.current_timeline
             if current_timeline:
                 timeline_name = current_timeline.GetName()
                 print(f"✓ Current timeline: '{timeline_name}'")
@@ -474,9 +564,7 @@ def main():
     # Clean up
     resolver.disconnect()
     
-    print("=" * 50)
-    print("SCRIPT COMPLETED SUCCESSFULLY!")
-    print("=" * 50)
+    _banner("SCRIPT COMPLETED SUCCESSFULLY!")
 
 
 if __name__ == "__main__":
@@ -487,5 +575,6 @@ if __name__ == "__main__":
         sys.exit(0)
     except Exception as e:
         print(f"\nUnexpected error: {e}")
-        print(traceback.format_exc())
+        import traceback
+        traceback.print_exc(file=sys.stdout)
         sys.exit(1)
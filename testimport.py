@@ -13,11 +13,25 @@ resolve_script_module_path = os.path.join(
     "DaVinciResolveScript.py"
 )
 
-# Add the directory containing the module to the Python path
-sys.path.append(os.path.dirname(resolve_script_module_path))
-
-try:
-    import DaVinciResolveScript as dvr_script
-    print("Import successful!")
-except Exception as e:
-    print(f"Error importing DaVinciResolveScript: {e}")
+# Add the directory containing the module to the front of the Python path, once
+_module_dir = os.path.dirname(resolve_script_module_path)
+if _module_dir not in sys.path:
+    sys.path.insert(0, _module_dir)
+
+
+def _load():
+    """Import DaVinciResolveScript only when the check actually runs."""
+    import DaVinciResolveScript
+    return DaVinciResolveScript
+
+
+def main():
+    try:
+        _load()
+        print("Import successful!")
+    except Exception as e:
+        print(f"Error importing DaVinciResolveScript: {e}")
+
+
+if __name__ == "__main__":
+    main()